@@ -23,6 +23,7 @@ from pynicotine.events import events
 from pynicotine.logfacility import log
 from pynicotine.utils import censor_text
 from pynicotine.utils import find_whole_word
+from pynicotine.utils import replace_text
 
 
 class Room:
@@ -182,8 +183,7 @@ class ChatRooms:
         room, message = event
 
         if config.sections["words"]["replacewords"]:
-            for word, replacement in config.sections["words"]["autoreplaced"].items():
-                message = message.replace(str(word), str(replacement))
+            message = replace_text(message, replacements=config.sections["words"]["autoreplaced"])
 
         core.send_message_to_server(slskmessages.SayChatroom(room, message))
         core.pluginhandler.outgoing_public_chat_notification(room, message)
@@ -74,6 +74,7 @@ class ChatRooms(IconNotebook):
         self.toolbar_default_widget = window.chatrooms_entry
 
         self.highlighted_rooms = {}
+        self.pages_by_container = {}
         self.completion = ChatCompletion()
         self.spell_checker = SpellChecker()
         self.room_list = RoomList(window)
@@ -165,30 +166,30 @@ class ChatRooms(IconNotebook):
         if self.window.current_page_id != self.window.chatrooms_page.id:
             return
 
-        for room, tab in self.pages.items():
-            if tab.container != page:
-                continue
+        tab = self.pages_by_container.get(page)
 
-            self.spell_checker.set_entry(tab.chat_entry)
-            self.completion.set_entry(tab.chat_entry)
-            tab.update_room_user_completions()
+        if tab is None:
+            return
 
-            if self.command_help is None:
-                self.command_help = ChatCommandHelp(window=self.window, interface="chatroom")
+        self.spell_checker.set_entry(tab.chat_entry)
+        self.completion.set_entry(tab.chat_entry)
+        tab.update_room_user_completions()
 
-            if self.room_wall is None:
-                self.room_wall = RoomWall(window=self.window)
+        if self.command_help is None:
+            self.command_help = ChatCommandHelp(window=self.window, interface="chatroom")
 
-            self.command_help.set_menu_button(tab.help_button)
-            self.room_wall.set_menu_button(tab.room_wall_button)
-            self.room_wall.room = room
+        if self.room_wall is None:
+            self.room_wall = RoomWall(window=self.window)
 
-            if not tab.loaded:
-                tab.load()
+        self.command_help.set_menu_button(tab.help_button)
+        self.room_wall.set_menu_button(tab.room_wall_button)
+        self.room_wall.room = tab.room
 
-            # Remove highlight
-            self.unhighlight_room(room)
-            break
+        if not tab.loaded:
+            tab.load()
+
+        # Remove highlight
+        self.unhighlight_room(tab.room)
 
     def on_create_room_response(self, dialog, _response_id, room):
         private = dialog.get_option_value()
@@ -229,13 +230,11 @@ class ChatRooms(IconNotebook):
         if self.window.current_page_id != self.window.chatrooms_page.id:
             return
 
-        page = self.get_current_page()
+        tab = self.pages_by_container.get(self.get_current_page())
 
-        for room, tab in self.pages.items():
-            if tab.container == page:
-                # Remove highlight
-                self.unhighlight_room(room)
-                break
+        if tab is not None:
+            # Remove highlight
+            self.unhighlight_room(tab.room)
 
     def show_room(self, room, is_private=False, switch_page=True, remembered=False):
 
@@ -243,6 +242,7 @@ class ChatRooms(IconNotebook):
             is_global = (room == core.chatrooms.GLOBAL_ROOM_NAME)
             tab_position = 0 if is_global and not remembered else -1
             self.pages[room] = tab = ChatRoom(self, room, is_private=is_private, is_global=is_global)
+            self.pages_by_container[tab.container] = tab
 
             self.insert_page(
                 tab.container, room, focus_callback=tab.on_focus, close_callback=tab.on_leave_room,
@@ -282,6 +282,7 @@ class ChatRooms(IconNotebook):
         page.clear()
         self.remove_page(page.container, page_args=(room, page.is_private))
         del self.pages[room]
+        del self.pages_by_container[page.container]
         page.destroy()
 
         if room != core.chatrooms.GLOBAL_ROOM_NAME:
@@ -377,12 +378,10 @@ class ChatRooms(IconNotebook):
 
     def update_completions(self, completions):
 
-        page = self.get_current_page()
+        tab = self.pages_by_container.get(self.get_current_page())
 
-        for tab in self.pages.values():
-            if tab.container == page:
-                tab.update_completions(completions)
-                break
+        if tab is not None:
+            tab.update_completions(completions)
 
     def update_widgets(self):
 
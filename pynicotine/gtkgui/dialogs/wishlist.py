@@ -204,12 +204,8 @@ class WishList(Dialog):
         if page is None:
             return
 
-        text = None
-
-        for tab in self.application.window.search.pages.values():
-            if tab is not None and tab.container == page:
-                text = tab.text
-                break
+        tab = self.application.window.search.pages_by_container.get(page)
+        text = tab.text if tab is not None else None
 
         if not text:
             self.list_view.unselect_all_rows()
@@ -62,6 +62,7 @@ class PrivateChats(IconNotebook):
         self.toolbar_default_widget = window.private_entry
 
         self.highlighted_users = []
+        self.pages_by_container = {}
         self.completion = ChatCompletion()
         self.spell_checker = SpellChecker()
         self.history = ChatHistory(window)
@@ -137,25 +138,25 @@ class PrivateChats(IconNotebook):
         if self.window.current_page_id != self.window.private_page.id:
             return
 
-        for user, tab in self.pages.items():
-            if tab.container != page:
-                continue
+        tab = self.pages_by_container.get(page)
+
+        if tab is None:
+            return
 
-            self.spell_checker.set_entry(tab.chat_entry)
-            self.completion.set_entry(tab.chat_entry)
-            tab.update_room_user_completions()
+        self.spell_checker.set_entry(tab.chat_entry)
+        self.completion.set_entry(tab.chat_entry)
+        tab.update_room_user_completions()
 
-            if self.command_help is None:
-                self.command_help = ChatCommandHelp(window=self.window, interface="private_chat")
+        if self.command_help is None:
+            self.command_help = ChatCommandHelp(window=self.window, interface="private_chat")
 
-            self.command_help.set_menu_button(tab.help_button)
+        self.command_help.set_menu_button(tab.help_button)
 
-            if not tab.loaded:
-                tab.load()
+        if not tab.loaded:
+            tab.load()
 
-            # Remove highlight if selected tab belongs to a user in the list of highlights
-            self.unhighlight_user(user)
-            break
+        # Remove highlight if selected tab belongs to a user in the list of highlights
+        self.unhighlight_user(tab.user)
 
     def on_get_private_chat(self, *_args):
 
@@ -179,13 +180,11 @@ class PrivateChats(IconNotebook):
         if self.window.current_page_id != self.window.private_page.id:
             return
 
-        page = self.get_current_page()
+        tab = self.pages_by_container.get(self.get_current_page())
 
-        for user, tab in self.pages.items():
-            if tab.container == page:
-                # Remove highlight
-                self.unhighlight_user(user)
-                break
+        if tab is not None:
+            # Remove highlight
+            self.unhighlight_user(tab.user)
 
     def user_status(self, msg):
 
@@ -204,6 +203,7 @@ class PrivateChats(IconNotebook):
 
         if user not in self.pages:
             self.pages[user] = page = PrivateChat(self, user)
+            self.pages_by_container[page.container] = page
             tab_position = -1 if remembered else 0
 
             self.insert_page(
@@ -233,6 +233,7 @@ class PrivateChats(IconNotebook):
         page.clear()
         self.remove_page(page.container, page_args=(user,))
         del self.pages[user]
+        del self.pages_by_container[page.container]
         page.destroy()
 
     def highlight_user(self, user):
@@ -269,12 +270,10 @@ class PrivateChats(IconNotebook):
 
     def update_completions(self, completions):
 
-        page = self.get_current_page()
+        tab = self.pages_by_container.get(self.get_current_page())
 
-        for tab in self.pages.values():
-            if tab.container == page:
-                tab.update_completions(completions)
-                break
+        if tab is not None:
+            tab.update_completions(completions)
 
     def update_widgets(self):
 
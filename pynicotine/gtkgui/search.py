@@ -76,6 +76,7 @@ class Searches(IconNotebook):
         self.toolbar_start_content = window.search_title
         self.toolbar_end_content = window.search_end
         self.toolbar_default_widget = window.search_entry
+        self.pages_by_container = {}
 
         self.modes = {
             "global": _("_Global"),
@@ -167,12 +168,8 @@ class Searches(IconNotebook):
         if self.window.current_page_id != self.window.search_page.id:
             return
 
-        for tab in self.pages.values():
-            if tab.container != page:
-                continue
-
+        if page in self.pages_by_container:
             self.window.update_title()
-            break
 
     def on_search_mode(self, action, state):
 
@@ -254,6 +251,7 @@ class Searches(IconNotebook):
         label = full_text[:length]
         self.append_page(page.container, label, focus_callback=page.on_focus,
                          close_callback=page.on_close, full_text=full_text)
+        self.pages_by_container[page.container] = page
         page.set_label(self.get_tab_label_inner(page.container))
 
         return page
@@ -308,6 +306,7 @@ class Searches(IconNotebook):
                 mode = "global"
 
             self.remove_page(page.container, page_args=(page.text, mode, page.room, page.searched_users))
+            del self.pages_by_container[page.container]
 
         del self.pages[token]
         page.destroy()
@@ -1411,35 +1410,38 @@ class Search:
 
     def select_result(self, iterator):
 
-        user = self.tree_view.get_row_value(iterator, "user")
+        get_row_value = self.tree_view.get_row_value
+        user = get_row_value(iterator, "user")
 
         if user not in self.selected_users:
             self.selected_users[user] = None
 
-        if self.tree_view.get_row_value(iterator, "filename"):
-            row_id = self.tree_view.get_row_value(iterator, "id_data")
+        # Walk child rows iteratively, all of them belong to the same user
+        iterators = [iterator]
 
-            if row_id not in self.selected_results:
-                self.selected_results[row_id] = iterator
+        while iterators:
+            iterator = iterators.pop()
 
-            return
+            if get_row_value(iterator, "filename"):
+                row_id = get_row_value(iterator, "id_data")
 
-        self.select_child_results(iterator, user)
+                if row_id not in self.selected_results:
+                    self.selected_results[row_id] = iterator
 
-    def select_child_results(self, iterator, user):
+                continue
 
-        folder_path = self.tree_view.get_row_value(iterator, "folder")
+            folder_path = get_row_value(iterator, "folder")
 
-        if folder_path:
-            user_folder_path = user + folder_path
-            row_data = self.folders[user_folder_path]
-        else:
-            row_data = self.users[user]
+            if folder_path:
+                user_folder_path = user + folder_path
+                row_data = self.folders[user_folder_path]
+            else:
+                row_data = self.users[user]
 
-        _row_iter, child_transfers = row_data
+            _row_iter, child_iterators = row_data
 
-        for i_iterator in child_transfers:
-            self.select_result(i_iterator)
+            # Reversed, to preserve the order of rows when popping from the stack
+            iterators.extend(reversed(child_iterators))
 
     def select_results(self):
 
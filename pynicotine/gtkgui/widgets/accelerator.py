@@ -65,6 +65,15 @@ class Accelerator:
 
         widget.connect("key-press-event", self._activate_accelerator)
 
+    @classmethod
+    def _get_keycodes(cls, key):
+
+        if not key:
+            return set()
+
+        _valid, keys = cls.KEYMAP.get_entries_for_keyval(key)
+        return {key.keycode for key in keys}
+
     @classmethod
     def parse_accelerator(cls, accelerator):
 
@@ -72,17 +81,23 @@ class Accelerator:
 
         if not keycodes_mods_accel:
             *_args, key, mods = Gtk.accelerator_parse(accelerator)
-
-            if key:
-                _valid, keys = cls.KEYMAP.get_entries_for_keyval(key)
-                keycodes = {key.keycode for key in keys}
-            else:
-                keycodes = []
+            keycodes = cls._get_keycodes(key)
 
             cls.keycodes_mods[accelerator] = keycodes_mods_accel = (keycodes, mods)
 
         return keycodes_mods_accel
 
+    @classmethod
+    def on_keys_changed(cls, *_args):
+
+        # Keyboard layout changed. Update cached keycodes in place, since
+        # existing accelerators hold references to the same sets.
+        for accelerator, (keycodes, _mods) in cls.keycodes_mods.items():
+            *_unused, key, _mods = Gtk.accelerator_parse(accelerator)
+
+            keycodes.clear()
+            keycodes.update(cls._get_keycodes(key))
+
     def _activate_accelerator(self, widget, event):
 
         activated_mods = event.state
@@ -105,6 +120,8 @@ class Accelerator:
 
 
 if GTK_API_VERSION == 3:
+    Accelerator.KEYMAP.connect("keys-changed", Accelerator.on_keys_changed)
+
     ALL_MODIFIERS = (Accelerator.parse_accelerator("<Primary>")[1]
                      | Accelerator.parse_accelerator("<Shift>")[1]
                      | Accelerator.parse_accelerator("<Alt>")[1])
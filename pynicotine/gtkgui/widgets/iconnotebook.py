@@ -95,22 +95,14 @@ class TabLabel:
         self.eventbox.remove(self.box)
         self.container.remove(self.eventbox)
 
-    def _add_close_button(self):
-
-        if self.close_button is not None:
-            return
-
-        if not self.close_button_visible:
-            return
+    def _create_close_button(self):
 
         if GTK_API_VERSION >= 4:
             self.close_button = Gtk.Button(icon_name="window-close-symbolic")
             self.close_button.is_close_button = True
             self.close_button.get_child().is_close_button = True
-            self.container.append(self.close_button)  # pylint: disable=no-member
         else:
             self.close_button = Gtk.Button(image=Gtk.Image(icon_name="window-close-symbolic"))
-            self.container.add(self.close_button)     # pylint: disable=no-member
             self.close_button.add_events(             # pylint: disable=no-member
                 int(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK))
 
@@ -121,11 +113,27 @@ class TabLabel:
         if self.close_callback is not None:
             self.close_button.connect("clicked", self.close_callback)
 
+    def _add_close_button(self):
+
+        if not self.close_button_visible:
+            return
+
+        if self.close_button is None:
+            # Button is created once, and reused when repacking the tab
+            self._create_close_button()
+
+        elif self.close_button.get_parent() is not None:
+            return
+
+        if GTK_API_VERSION >= 4:
+            self.container.append(self.close_button)  # pylint: disable=no-member
+        else:
+            self.container.add(self.close_button)     # pylint: disable=no-member
+
     def _remove_close_button(self):
 
-        if self.close_button is not None:
+        if self.close_button is not None and self.close_button.get_parent() is not None:
             self.container.remove(self.close_button)
-            self.close_button = None
 
     def _pack_children(self):
 
@@ -222,7 +230,7 @@ class TabLabel:
 
         icon_name = USER_STATUS_ICON_NAMES.get(status)
 
-        if not icon_name:
+        if not icon_name or self.start_icon.get_icon_name() == icon_name:
             return
 
         self.set_start_icon_name(icon_name)
@@ -249,7 +257,13 @@ class TabLabel:
         self.container.set_visible(True)
 
     def set_text(self, text):
-        self.label.set_text(text.strip())
+
+        text = text.strip()
+
+        if self.label.get_text() == text:
+            return
+
+        self.label.set_text(text)
 
     def get_text(self):
         return self.label.get_text()
@@ -273,6 +287,8 @@ class IconNotebook:
         self.reorder_page_callback = reorder_page_callback
         self.switch_page_handler = None
         self.reorder_page_handler = None
+        self.focus_page_source_id = None
+        self.pending_focus_page = None
 
         self.pages = {}
         self.tab_labels = {}
@@ -351,6 +367,9 @@ class IconNotebook:
         if self.reorder_page_handler is not None:
             self.widget.disconnect(self.reorder_page_handler)
 
+        if self.focus_page_source_id is not None:
+            GLib.source_remove(self.focus_page_source_id)
+
         for i in reversed(range(self.get_n_pages())):
             page = self.get_nth_page(i)
             self.remove_page(page)
@@ -383,10 +402,10 @@ class IconNotebook:
 
     def set_tab_closers(self):
 
-        for i in range(self.get_n_pages()):
-            page = self.get_nth_page(i)
-            tab_label = self.get_tab_label(page)
-            tab_label.set_close_button_visibility(config.sections["ui"]["tabclosers"])
+        tab_closers = config.sections["ui"]["tabclosers"]
+
+        for tab_label in self.tab_labels.values():
+            tab_label.set_close_button_visibility(tab_closers)
 
     def append_page(self, page, text, focus_callback=None, close_callback=None, full_text=None, user=None):
         self.insert_page(page, text, focus_callback, close_callback, full_text, user, position=-1)
@@ -435,6 +454,9 @@ class IconNotebook:
         if hasattr(page, "focus_callback"):
             del page.focus_callback
 
+        if page == self.pending_focus_page:
+            self.pending_focus_page = None
+
         tab_label = self.tab_labels.pop(page)
         tab_label.destroy()
 
@@ -640,6 +662,17 @@ class IconNotebook:
             # Show active page and focus default widget
             self.emit_switch_page_signal()
 
+    def on_focus_pending_page(self):
+
+        page = self.pending_focus_page
+
+        self.focus_page_source_id = self.pending_focus_page = None
+
+        if page is not None:
+            self.on_focus_page(page)
+
+        return False
+
     def on_focus_page(self, page):
 
         if not hasattr(page, "focus_callback"):
@@ -658,7 +691,17 @@ class IconNotebook:
     def _on_remove_all_pages(self, *args):
 
         self.freeze()
+
+        # Don't switch to (and load) each remaining page while closing them one by one
+        if self.switch_page_handler is not None:
+            self.widget.handler_block(self.switch_page_handler)
+
         self.on_remove_all_pages(args)
+
+        if self.switch_page_handler is not None:
+            self.widget.handler_unblock(self.switch_page_handler)
+            self.emit_switch_page_signal()
+
         self.unfreeze()
 
         # Don't allow restoring tabs after removing all
@@ -684,7 +727,12 @@ class IconNotebook:
         if (self.should_focus_page
                 and (self.parent_page is None or self.window.current_page_id == self.parent_page.id
                      and self.window.notebook.should_focus_page)):
-            GLib.idle_add(self.on_focus_page, new_page, priority=GLib.PRIORITY_HIGH_IDLE)
+            # Coalesce focus requests when switching through many tabs quickly
+            self.pending_focus_page = new_page
+
+            if self.focus_page_source_id is None:
+                self.focus_page_source_id = GLib.idle_add(
+                    self.on_focus_pending_page, priority=GLib.PRIORITY_HIGH_IDLE)
 
         # Dismiss tab highlight
         if self.parent_page is not None:
@@ -191,6 +191,19 @@ class PopupMenu:
         menuitem = self._create_menu_item(item)
         self.menu_section.append_item(menuitem)
 
+    def _set_first_item_label(self, menuitem, label):
+        """Updates the label of the menu's first item, replacing only that
+        item in its section instead of the whole section."""
+
+        if menuitem.get_attribute_value("label", GLib.VariantType("s")).get_string() == label:
+            return
+
+        menuitem.set_label(label)
+
+        section = self.model.get_item_link(0, Gio.MENU_LINK_SECTION)
+        section.remove(0)
+        section.insert_item(0, menuitem)
+
     def update_model(self):
         """This function is called before a menu model needs to be manipulated
         (enabling/disabling actions, showing a menu in the GUI)"""
@@ -371,9 +384,7 @@ class FilePopupMenu(PopupMenu):
     def set_num_selected_files(self, num_files):
 
         self.actions["selected_files"].set_enabled(False)
-        self.items["selected_files"].set_label(_("%s File(s) Selected") % num_files)
-        self.model.remove(0)
-        self.model.prepend_item(self.items["selected_files"])
+        self._set_first_item_label(self.items["selected_files"], _("%s File(s) Selected") % num_files)
 
 
 class UserPopupMenu(PopupMenu):
@@ -435,9 +446,8 @@ class UserPopupMenu(PopupMenu):
         if not user_item:
             return
 
-        user_item.set_label(self.username.replace("_", "__"))  # Escape underscores to disable mnemonics
-        self.model.remove(0)
-        self.model.prepend_item(user_item)
+        # Escape underscores to disable mnemonics
+        self._set_first_item_label(user_item, self.username.replace("_", "__"))
 
     def set_user(self, username):
 
@@ -489,7 +499,9 @@ class UserPopupMenu(PopupMenu):
             if not is_owned and not is_operator:
                 continue
 
-            if self.username in data["users"]:
+            is_user = (self.username in data["users"])
+
+            if is_user:
                 self.add_items(
                     ("#" + _("Remove from Private Room %s") % room, self.on_private_room_remove_user, room))
             else:
@@ -503,7 +515,7 @@ class UserPopupMenu(PopupMenu):
                 self.add_items(
                     ("#" + _("Remove as Operator of %s") % room, self.on_private_room_remove_operator, room))
 
-            elif self.username in data["users"]:
+            elif is_user:
                 self.add_items(
                     ("#" + _("Add as Operator of %s") % room, self.on_private_room_add_operator, room))
 
@@ -158,11 +158,13 @@ class ChatCompletion:
         self.midway_completion = False  # True if the user just used tab completion
         self.selecting_completion = False  # True if the list box is open with suggestions
         self.is_inserting_completion = False
+        self.match_entry_text = None
+        self.match_key = None
 
         self.entry = None
         self.entry_changed_handler = None
         self.entry_completion = None
-        self.model = Gtk.ListStore(str)
+        self.model = Gtk.ListStore(str, str)  # Word, lowercase word for matching
 
         self.column_numbers = list(range(self.model.get_n_columns()))
 
@@ -205,7 +207,7 @@ class ChatCompletion:
             return
 
         if config.sections["words"]["dropdown"]:
-            iterator = self.model.insert_with_valuesv(-1, self.column_numbers, [item])
+            iterator = self.model.insert_with_valuesv(-1, self.column_numbers, [item, item.lower()])
         else:
             iterator = None
 
@@ -231,26 +233,31 @@ class ChatCompletion:
         self.entry_completion.set_popup_completion(config_words["dropdown"])
         self.entry_completion.set_minimum_key_length(config_words["characters"])
 
+        # Detach model while clearing and adding rows, to avoid refiltering the completion for each row
+        self.entry_completion.set_model(None)
         self.model.clear()
         self.completions.clear()
 
         if not self.is_completion_enabled():
+            self.entry_completion.set_model(self.model)
             return
 
         for word in sorted(completions, key=strxfrm):
             word = str(word)
 
             if config_words["dropdown"]:
-                iterator = self.model.insert_with_valuesv(-1, self.column_numbers, [word])
+                iterator = self.model.insert_with_valuesv(-1, self.column_numbers, [word, word.lower()])
             else:
                 iterator = None
 
             self.completions[word] = iterator
 
-    def entry_completion_find_match(self, _completion, entry_text, iterator):
+        self.entry_completion.set_model(self.model)
+
+    def get_match_key(self, entry_text):
 
         if not entry_text:
-            return False
+            return None
 
         # Get word to the left of current position
         if " " in entry_text:
@@ -260,12 +267,26 @@ class ChatCompletion:
             split_key = entry_text
 
         if not split_key or len(split_key) < config.sections["words"]["characters"]:
+            return None
+
+        return split_key
+
+    def entry_completion_find_match(self, _completion, entry_text, iterator):
+
+        if entry_text != self.match_entry_text:
+            # Called for every row in the model, only parse the entry text once
+            self.match_entry_text = entry_text
+            self.match_key = self.get_match_key(entry_text)
+
+        split_key = self.match_key
+
+        if split_key is None:
             return False
 
         # Case-insensitive matching
-        item_text = self.model.get_value(iterator, 0).lower()
+        item_text = self.model.get_value(iterator, 1)
 
-        if item_text.startswith(split_key) and item_text != split_key:
+        if len(item_text) > len(split_key) and item_text.startswith(split_key):
             self.selecting_completion = True
             return True
 
@@ -304,6 +325,8 @@ class ChatCompletion:
         if not self.is_inserting_completion:
             self.midway_completion = self.selecting_completion = False
 
+        self.match_entry_text = None
+
     def on_tab_complete_accelerator(self, _widget, _state, backwards=False):
         """Tab and Shift+Tab: tab complete chat."""
 
@@ -368,6 +391,8 @@ class CompletionEntry:
         self.model = model
         self.column = column
         self.completions = {}
+        self.match_entry_text = None
+        self.match_key = None
 
         if model is None:
             self.model = model = Gtk.ListStore(str)
@@ -401,12 +426,17 @@ class CompletionEntry:
         if not entry_text:
             return False
 
+        if entry_text != self.match_entry_text:
+            # Called for every row in the model, only lowercase the entry text once
+            self.match_entry_text = entry_text
+            self.match_key = entry_text.lower()
+
         item_text = self.model.get_value(iterator, self.column)
 
         if not item_text:
             return False
 
-        if item_text.lower().startswith(entry_text.lower()):
+        if item_text.lower().startswith(self.match_key):
             return True
 
         return False
@@ -955,7 +985,9 @@ class TextSearchBar:
         text_buffer = self.textview.get_buffer()
         query = self.entry.get_text()
 
-        self.textview.emit("select-all", False)
+        if text_buffer.get_has_selection():
+            # Clear previous match
+            self.textview.emit("select-all", False)
 
         if search_type == "typing":
             start, end = text_buffer.get_bounds()
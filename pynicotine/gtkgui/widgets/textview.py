@@ -53,7 +53,8 @@ class TextView:
         DEFAULT_CURSOR = POINTER_CURSOR = TEXT_CURSOR = None
 
     MAX_NUM_LINES = 50000
-    URL_REGEX = re.compile("(\\w+\\://[^\\s]+)|(www\\.\\w+\\.[^\\s]+)|(mailto\\:[^\\s]+)")
+    # Word boundary before the scheme prevents quadratic backtracking on long words
+    URL_REGEX = re.compile(r"\b\w+://\S+|www\.\w+\.\S+|mailto:\S+")
 
     def __init__(self, parent, auto_scroll=False, parse_urls=True, editable=True,
                  horizontal_margin=12, vertical_margin=8, pixels_above_lines=1, pixels_below_lines=1):
@@ -86,6 +87,9 @@ class TextView:
         self.default_tags = {}
         self.parse_urls = parse_urls
 
+        # Single tag shared by all URLs, the URL itself is read from the tagged text
+        self.url_tag = self.create_tag("urlcolor")
+
         if GTK_API_VERSION >= 4:
             self.textbuffer.set_enable_undo(editable)
 
@@ -127,20 +131,6 @@ class TextView:
         self.adjustment_value = (self.adjustment.get_upper() - self.adjustment.get_page_size())
         self.adjustment.set_value(self.adjustment_value)
 
-    def _insert_text(self, text, tag=None):
-
-        if not text:
-            return
-
-        if tag is not None:
-            start_offset = self.end_iter.get_offset()
-
-        self.textbuffer.insert(self.end_iter, text)
-
-        if tag is not None:
-            start_iter = self.textbuffer.get_iter_at_offset(start_offset)
-            self.textbuffer.apply_tag(tag, start_iter, self.end_iter)
-
     def _remove_old_lines(self, num_lines):
 
         if num_lines < self.MAX_NUM_LINES:
@@ -160,44 +150,66 @@ class TextView:
     def append_line(self, line, message_type=None, timestamp=None, timestamp_format=None,
                     username=None, usertag=None):
 
+        textbuffer = self.textbuffer
         tag = self.default_tags.get(message_type)
-        num_lines = self.textbuffer.get_line_count()
+        num_lines = textbuffer.get_line_count()
         line = str(line).strip("\n")
 
+        # Build the complete line first, and insert it into the buffer at once
+        text_parts = []
+        tag_offsets = []
+        offset = 0
+
         if timestamp_format:
             line = time.strftime(timestamp_format, time.localtime(timestamp)) + " " + line
 
-        if self.textbuffer.get_char_count() > 0:
+        if textbuffer.get_char_count() > 0:
             # No tag applied on line breaks to prevent visual glitch where text on the
             # next line has the wrong color
-            self._insert_text("\n")
+            text_parts.append("\n")
+            offset = 1
 
         # Tag usernames with popup menu creating tag, and away/online/offline colors
-        if username and username in line:
-            start = line.find(username)
+        start = line.find(username) if username else -1
 
-            self._insert_text(line[:start], tag)
-            self._insert_text(username, usertag)
+        if start > -1:
+            end = start + len(username)
 
-            line = line[start + len(username):]
+            text_parts.append(line[:end])
+            tag_offsets.append((offset, offset + start, tag))
+            tag_offsets.append((offset + start, offset + end, usertag))
+
+            line = line[end:]
+            offset += end
 
         # Highlight urls, if found and tag them
+        position = 0
+
         if self.parse_urls and ("://" in line or "www." in line or "mailto:" in line):
-            # Match first url
-            match = self.URL_REGEX.search(line)
+            for match in self.URL_REGEX.finditer(line):
+                start = match.start()
+                end = match.end()
+
+                tag_offsets.append((offset + position, offset + start, tag))
+                tag_offsets.append((offset + start, offset + end, self.url_tag))
+                position = end
+
+        text_parts.append(line)
+        tag_offsets.append((offset + position, offset + len(line), tag))
 
-            while match:
-                self._insert_text(line[:match.start()], tag)
+        start_offset = self.end_iter.get_offset()
+        textbuffer.insert(self.end_iter, "".join(text_parts))
 
-                url = match.group()
-                urltag = self.create_tag("urlcolor", url=url)
-                self._insert_text(url, urltag)
+        for tag_start, tag_end, text_tag in tag_offsets:
+            if text_tag is None or tag_start >= tag_end:
+                continue
 
-                # Match remaining url
-                line = line[match.end():]
-                match = self.URL_REGEX.search(line)
+            textbuffer.apply_tag(
+                text_tag,
+                textbuffer.get_iter_at_offset(start_offset + tag_start),
+                textbuffer.get_iter_at_offset(start_offset + tag_end)
+            )
 
-        self._insert_text(line, tag)
         self._remove_old_lines(num_lines)
 
         return num_lines
@@ -212,24 +224,53 @@ class TextView:
 
         return self.textbuffer.get_text(start_iter, self.end_iter, include_hidden_chars=True)
 
-    def get_tags_for_pos(self, pos_x, pos_y):
+    def get_iter_for_pos(self, pos_x, pos_y):
 
         buf_x, buf_y = self.widget.window_to_buffer_coords(Gtk.TextWindowType.WIDGET, pos_x, pos_y)
         over_text, iterator, _trailing = self.widget.get_iter_at_position(buf_x, buf_y)
 
         if not over_text:
             # Iterators are returned for whitespace after the last character, avoid accidental URL clicks
+            return None
+
+        return iterator
+
+    def get_tags_for_pos(self, pos_x, pos_y):
+
+        iterator = self.get_iter_for_pos(pos_x, pos_y)
+
+        if iterator is None:
             return []
 
         return iterator.get_tags()
 
+    def get_url_for_iter(self, iterator):
+
+        if not iterator.has_tag(self.url_tag):
+            return ""
+
+        start_iter = iterator.copy()
+        end_iter = iterator.copy()
+
+        if not start_iter.starts_tag(self.url_tag):
+            start_iter.backward_to_tag_toggle(self.url_tag)
+
+        end_iter.forward_to_tag_toggle(self.url_tag)
+        url = self.textbuffer.get_text(start_iter, end_iter, include_hidden_chars=True)
+
+        if url.startswith("www."):
+            url = "http://" + url
+
+        return url
+
     def get_url_for_current_pos(self):
 
-        for tag in self.get_tags_for_pos(self.pressed_x, self.pressed_y):
-            if hasattr(tag, "url"):
-                return tag.url
+        iterator = self.get_iter_for_pos(self.pressed_x, self.pressed_y)
+
+        if iterator is None:
+            return ""
 
-        return ""
+        return self.get_url_for_iter(iterator)
 
     def grab_focus(self):
         self.widget.grab_focus()
@@ -261,7 +302,7 @@ class TextView:
                 cursor = self.DEFAULT_CURSOR
                 break
 
-            if hasattr(tag, "url"):
+            if tag == self.url_tag:
                 cursor = self.POINTER_CURSOR
                 break
 
@@ -273,7 +314,7 @@ class TextView:
 
     # Text Tags (Usernames, URLs) #
 
-    def create_tag(self, color_id=None, callback=None, username=None, url=None):
+    def create_tag(self, color_id=None, callback=None, username=None):
 
         tag = self.textbuffer.create_tag()
 
@@ -281,12 +322,6 @@ class TextView:
             update_tag_visuals(tag, color_id=color_id)
             tag.color_id = color_id
 
-        if url:
-            if url.startswith("www."):
-                url = "http://" + url
-
-            tag.url = url
-
         if username:
             tag.callback = callback
             tag.username = username
@@ -313,9 +348,14 @@ class TextView:
         if self.textbuffer.get_has_selection():
             return False
 
-        for tag in self.get_tags_for_pos(pressed_x, pressed_y):
-            if hasattr(tag, "url"):
-                open_uri(tag.url)
+        iterator = self.get_iter_for_pos(pressed_x, pressed_y)
+
+        if iterator is None:
+            return False
+
+        for tag in iterator.get_tags():
+            if tag == self.url_tag:
+                open_uri(self.get_url_for_iter(iterator))
                 return True
 
             if hasattr(tag, "username"):
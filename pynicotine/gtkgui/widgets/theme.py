@@ -420,6 +420,16 @@ USER_STATUS_COLORS = {
     UserStatus.AWAY: "useraway",
     UserStatus.OFFLINE: "useroffline"
 }
+USERNAME_WEIGHTS = {
+    "bold": Pango.Weight.BOLD
+}
+USERNAME_STYLES = {
+    "italic": Pango.Style.ITALIC
+}
+USERNAME_UNDERLINES = {
+    "underline": Pango.Underline.SINGLE
+}
+PARSED_COLORS = {}
 
 
 def add_css_class(widget, css_class):
@@ -455,16 +465,17 @@ def load_css(css_provider, data):
 
 def _get_custom_font_css():
 
+    ui_config = config.sections["ui"]
     css = bytearray()
 
     for css_selector, font in (
-        ("window, popover", config.sections["ui"]["globalfont"]),
-        ("treeview", config.sections["ui"]["listfont"]),
-        ("textview", config.sections["ui"]["textviewfont"]),
-        (".chat-view textview", config.sections["ui"]["chatfont"]),
-        (".search-view treeview", config.sections["ui"]["searchfont"]),
-        (".transfers-view treeview", config.sections["ui"]["transfersfont"]),
-        (".userbrowse-view treeview", config.sections["ui"]["browserfont"])
+        ("window, popover", ui_config["globalfont"]),
+        ("treeview", ui_config["listfont"]),
+        ("textview", ui_config["textviewfont"]),
+        (".chat-view textview", ui_config["chatfont"]),
+        (".search-view treeview", ui_config["searchfont"]),
+        (".transfers-view treeview", ui_config["transfersfont"]),
+        (".userbrowse-view treeview", ui_config["browserfont"])
     ):
         font_description = Pango.FontDescription.from_string(font)
 
@@ -483,18 +494,33 @@ def _get_custom_font_css():
     return css
 
 
+def _parse_color(color_hex):
+    """Returns a Gdk.RGBA for a color string, or None if the string is not a
+    valid color. Colors come from a handful of config values, so cache them."""
+
+    if not color_hex:
+        return None
+
+    if color_hex not in PARSED_COLORS:
+        rgba = Gdk.RGBA()
+        PARSED_COLORS[color_hex] = rgba if rgba.parse(color_hex) else None
+
+    return PARSED_COLORS[color_hex]
+
+
 def _is_color_valid(color_hex):
-    return color_hex and Gdk.RGBA().parse(color_hex)
+    return _parse_color(color_hex) is not None
 
 
 def _get_custom_color_css():
 
+    ui_config = config.sections["ui"]
     css = bytearray()
 
     # User status colors
-    online_color = config.sections["ui"]["useronline"]
-    away_color = config.sections["ui"]["useraway"]
-    offline_color = config.sections["ui"]["useroffline"]
+    online_color = ui_config["useronline"]
+    away_color = ui_config["useraway"]
+    offline_color = ui_config["useroffline"]
 
     if _is_color_valid(online_color) and _is_color_valid(away_color) and _is_color_valid(offline_color):
         css.extend(
@@ -506,15 +532,15 @@ def _get_custom_color_css():
         )
 
     # Text colors
-    treeview_text_color = config.sections["ui"]["search"]
+    treeview_text_color = ui_config["search"]
 
     for css_selector, color in (
-        (".notebook-tab", config.sections["ui"]["tab_default"]),
-        (".notebook-tab-changed", config.sections["ui"]["tab_changed"]),
-        (".notebook-tab-highlight", config.sections["ui"]["tab_hilite"]),
-        ("entry", config.sections["ui"]["inputcolor"]),
+        (".notebook-tab", ui_config["tab_default"]),
+        (".notebook-tab-changed", ui_config["tab_changed"]),
+        (".notebook-tab-highlight", ui_config["tab_hilite"]),
+        ("entry", ui_config["inputcolor"]),
         ("treeview", treeview_text_color),
-        (".search-view treeview:disabled", config.sections["ui"]["searchq"])
+        (".search-view treeview:disabled", ui_config["searchq"])
     ):
         if _is_color_valid(color):
             css.extend(
@@ -527,7 +553,7 @@ def _get_custom_color_css():
 
     # Background colors
     for css_selector, color in (
-        ("entry", config.sections["ui"]["textbg"]),
+        ("entry", ui_config["textbg"]),
     ):
         if _is_color_valid(color):
             css.extend(
@@ -581,21 +607,22 @@ def update_custom_css():
 
 def update_tag_visuals(tag, color_id):
 
-    enable_colored_usernames = config.sections["ui"]["usernamehotspots"]
+    ui_config = config.sections["ui"]
+    enable_colored_usernames = ui_config["usernamehotspots"]
     is_hotspot_tag = (color_id in {"useraway", "useronline", "useroffline"})
-    color_hex = config.sections["ui"].get(color_id)
+    color_hex = ui_config.get(color_id)
     tag_props = tag.props
 
     if is_hotspot_tag and not enable_colored_usernames:
         color_hex = None
 
-    if not color_hex:
+    new_rgba = _parse_color(color_hex)
+
+    if new_rgba is None:
         if tag_props.foreground_rgba:
             tag_props.foreground_rgba = None
     else:
         current_rgba = tag_props.foreground_rgba
-        new_rgba = Gdk.RGBA()
-        new_rgba.parse(color_hex)
 
         if current_rgba is None or not new_rgba.equal(current_rgba):
             tag_props.foreground_rgba = new_rgba
@@ -608,16 +635,16 @@ def update_tag_visuals(tag, color_id):
     if not is_hotspot_tag:
         return
 
-    username_style = config.sections["ui"]["usernamestyle"]
+    username_style = ui_config["usernamestyle"]
+    weight_style = USERNAME_WEIGHTS.get(username_style, Pango.Weight.NORMAL)
+    italic_style = USERNAME_STYLES.get(username_style, Pango.Style.NORMAL)
+    underline_style = USERNAME_UNDERLINES.get(username_style, Pango.Underline.NONE)
 
-    weight_style = Pango.Weight.BOLD if username_style == "bold" else Pango.Weight.NORMAL
     if tag_props.weight != weight_style:
         tag_props.weight = weight_style
 
-    italic_style = Pango.Style.ITALIC if username_style == "italic" else Pango.Style.NORMAL
     if tag_props.style != italic_style:
         tag_props.style = italic_style
 
-    underline_style = Pango.Underline.SINGLE if username_style == "underline" else Pango.Underline.NONE
     if tag_props.underline != underline_style:
         tag_props.underline = underline_style
@@ -45,6 +45,12 @@ from pynicotine.gtkgui.widgets.theme import add_css_class
 
 class TreeView:
 
+    COUNTRY_LABELS = {}
+
+    # is_blank_at_pos() crashes in 4.12.0 - 4.12.2
+    # Remove check when GTK 4 version in Snap package is >= 4.12.3
+    HAS_BROKEN_IS_BLANK_AT_POS = ((4, 12, 2) >= (GTK_API_VERSION, GTK_MINOR_VERSION, GTK_MICRO_VERSION) >= (4, 12, 0))
+
     def __init__(self, window, parent, columns, has_tree=False, multi_select=False,
                  persistent_sort=False, name=None, secondary_name=None, activate_row_callback=None,
                  focus_in_callback=None, select_row_callback=None, delete_accelerator_callback=None,
@@ -67,6 +73,8 @@ class TreeView:
         self._column_gvalues = {}
         self._column_gesture_controllers = []
         self._column_numbers = None
+        self._column_menu_columns = None
+        self._column_menu_titles = []
         self._default_sort_column = None
         self._default_sort_type = Gtk.SortType.ASCENDING
         self._sort_column = None
@@ -437,6 +445,7 @@ class TreeView:
 
         saved_columns = {}
         column_config = config.sections["columns"]
+        previous_columns = column_config.get(self._widget_name, {})
 
         for column in self.widget.get_columns():
             title = column.id
@@ -448,19 +457,14 @@ class TreeView:
             # When a column is hidden, the correct width will be remembered during the
             # run it was hidden. Subsequent runs will yield a zero width, so we
             # attempt to re-use a previously saved non-zero column width instead.
-            try:
-                if width <= 0:
-                    if not visible:
-                        saved_columns[title] = {
-                            "visible": visible,
-                            "width": column_config[self._widget_name][title]["width"]
-                        }
+            if width <= 0:
+                if not visible:
+                    saved_columns[title] = {
+                        "visible": visible,
+                        "width": previous_columns.get(title, {}).get("width", width)
+                    }
 
-                    continue
-
-            except KeyError:
-                # No previously saved width, going with zero
-                pass
+                continue
 
             saved_columns[title] = columns = {"visible": visible, "width": width}
 
@@ -471,12 +475,7 @@ class TreeView:
                 columns["sort"] = "descending" if self._sort_type == Gtk.SortType.DESCENDING else "ascending"
 
         if self._secondary_name is not None:
-            try:
-                column_config[self._widget_name]
-            except KeyError:
-                column_config[self._widget_name] = {}
-
-            column_config[self._widget_name][self._secondary_name] = saved_columns
+            column_config.setdefault(self._widget_name, {})[self._secondary_name] = saved_columns
         else:
             column_config[self._widget_name] = saved_columns
 
@@ -604,12 +603,14 @@ class TreeView:
     def expand_root_rows(self):
 
         model = self.model
+        get_path = model.get_path
+        iter_next = model.iter_next
+        expand_row = self.widget.expand_row
         iterator = model.get_iter_first()
 
         while iterator:
-            path = model.get_path(iterator)
-            self.widget.expand_row(path, open_all=False)
-            iterator = model.iter_next(iterator)
+            expand_row(get_path(iterator), open_all=False)
+            iterator = iter_next(iterator)
 
     def get_focused_column(self):
         _path, column = self.widget.get_cursor()
@@ -644,8 +645,8 @@ class TreeView:
 
         self.widget.set_model(self.model)
 
-    @staticmethod
-    def get_icon_label(column, icon_name, is_short_country_label=False):
+    @classmethod
+    def get_icon_label(cls, column, icon_name, is_short_country_label=False):
 
         if column.id == "country":
             country_code = icon_name[-2:].upper()
@@ -653,8 +654,18 @@ class TreeView:
             if is_short_country_label:
                 return country_code
 
-            country_name = core.network_filter.COUNTRIES.get(country_code, _("Unknown"))
-            return f"{country_name} ({country_code})"
+            # Tooltips are requested on every pointer motion, reuse labels
+            country_label = cls.COUNTRY_LABELS.get(country_code)
+
+            if country_label is None:
+                country_name = core.network_filter.COUNTRIES.get(country_code)
+
+                if country_name is None:
+                    country_name = _("Unknown")
+
+                country_label = cls.COUNTRY_LABELS[country_code] = f"{country_name} ({country_code})"
+
+            return country_label
 
         if column.id == "status":
             return USER_STATUS_ICON_LABELS[icon_name]
@@ -739,25 +750,36 @@ class TreeView:
     def on_column_header_menu(self, menu, _treeview):
 
         columns = self.widget.get_columns()
-        visible_columns = [column for column in columns if column.get_visible()]
-        menu.clear()
+        visible_columns = {column for column in columns if column.get_visible()}
+        num_visible_columns = len(visible_columns)
 
-        for column_num, column in enumerate(columns, start=1):
-            title = column.get_title()
+        if columns != self._column_menu_columns:
+            # Only rebuild menu when columns have been reordered
+            self._column_menu_columns = columns
+            self._column_menu_titles.clear()
+            menu.clear()
 
-            if not title:
-                title = _("Column #%i") % column_num
+            for column_num, column in enumerate(columns, start=1):
+                title = column.get_title()
+
+                if not title:
+                    title = _("Column #%i") % column_num
+
+                menu.add_items(
+                    ("$" + title, None)
+                )
+                self._column_menu_titles.append(title)
 
-            menu.add_items(
-                ("$" + title, None)
-            )
             menu.update_model()
-            menu.actions[title].set_state(GLib.Variant("b", column in visible_columns))
 
-            if column in visible_columns:
-                menu.actions[title].set_enabled(len(visible_columns) > 1)
+            for title, column in zip(self._column_menu_titles, columns):
+                menu.actions[title].connect("activate", self.on_column_header_toggled, column)
+
+        for title, column in zip(self._column_menu_titles, columns):
+            is_visible = (column in visible_columns)
 
-            menu.actions[title].connect("activate", self.on_column_header_toggled, column)
+            menu.actions[title].set_state(GLib.Variant("b", is_visible))
+            menu.actions[title].set_enabled(not is_visible or num_visible_columns > 1)
 
     def on_column_position_changed(self, column, _param):
         """Save column position and width to config."""
@@ -811,9 +833,7 @@ class TreeView:
 
         bin_x, bin_y = self.widget.convert_widget_to_bin_window_coords(pos_x, pos_y)
 
-        # is_blank_at_pos() crashes in 4.12.0 - 4.12.2
-        # Remove check when GTK 4 version in Snap package is >= 4.12.3
-        if (4, 12, 2) >= (GTK_API_VERSION, GTK_MINOR_VERSION, GTK_MICRO_VERSION) >= (4, 12, 0):
+        if self.HAS_BROKEN_IS_BLANK_AT_POS:
             result = self.widget.get_path_at_pos(bin_x, bin_y)
 
             if not result:
@@ -82,18 +82,10 @@ def load(scope, path):
         builder.add_from_string(ui_data[path])
         builder.connect_signals(scope)                      # pylint: disable=no-member
 
-    widgets = builder.get_objects()
-
-    for obj in list(widgets):
-        try:
-            obj_name = Gtk.Buildable.get_name(obj)
-            if not obj_name.startswith("_"):
-                continue
-
-        except TypeError:
-            pass
-
-        widgets.remove(obj)
-
-    widgets.sort(key=Gtk.Buildable.get_name)
+    get_name = Gtk.Buildable.get_name
+    widgets = [
+        obj for obj in builder.get_objects()
+        if isinstance(obj, Gtk.Buildable) and not get_name(obj).startswith("_")
+    ]
+    widgets.sort(key=get_name)
     return widgets
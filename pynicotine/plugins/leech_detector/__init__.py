@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
+
 from pynicotine.pluginsystem import BasePlugin
 
 
@@ -26,6 +28,7 @@ class Plugin(BasePlugin):
         "%files%": "num_files",
         "%folders%": "num_folders"
     }
+    PLACEHOLDER_PATTERN = re.compile("|".join(re.escape(placeholder) for placeholder in PLACEHOLDERS))
 
     def __init__(self, *args, **kwargs):
 
@@ -80,45 +83,55 @@ class Plugin(BasePlugin):
             (self.settings["num_files"], self.settings["num_folders"])
         )
 
+    def accept_user(self, user, log_message, log_args):
+
+        detected_leechers = self.settings["detected_leechers"]
+
+        if user in detected_leechers:
+            detected_leechers.remove(user)
+
+        self.probed_users[user] = "okay"
+        self.log(log_message, log_args)
+
     def check_user(self, user, num_files, num_folders, source="server"):
 
-        if user not in self.probed_users:
+        probe_status = self.probed_users.get(user)
+
+        if probe_status is None:
             # We are not watching this user
             return
 
-        if self.probed_users[user] == "okay":
+        if probe_status == "okay":
             # User was already accepted previously, nothing to do
             return
 
-        if self.probed_users[user] == "requesting_shares" and source != "peer":
+        if probe_status == "requesting_shares" and source != "peer":
             # Waiting for stats from peer, but received stats from server. Ignore.
             return
 
-        is_user_accepted = (num_files >= self.settings["num_files"] and num_folders >= self.settings["num_folders"])
-
-        if is_user_accepted or user in self.core.buddies.users:
-            if user in self.settings["detected_leechers"]:
-                self.settings["detected_leechers"].remove(user)
+        settings = self.settings
+        detected_leechers = settings["detected_leechers"]
+        is_user_accepted = (num_files >= settings["num_files"] and num_folders >= settings["num_folders"])
 
-            self.probed_users[user] = "okay"
+        if is_user_accepted:
+            self.accept_user(user, "User %s is okay, sharing %s files in %s folders.", (user, num_files, num_folders))
+            return
 
-            if is_user_accepted:
-                self.log("User %s is okay, sharing %s files in %s folders.", (user, num_files, num_folders))
-            else:
-                self.log("Buddy %s is sharing %s files in %s folders. Not complaining.",
-                         (user, num_files, num_folders))
+        if user in self.core.buddies.users:
+            self.accept_user(
+                user, "Buddy %s is sharing %s files in %s folders. Not complaining.", (user, num_files, num_folders))
             return
 
-        if not self.probed_users[user].startswith("requesting"):
+        if not probe_status.startswith("requesting"):
             # We already dealt with the user this session
             return
 
-        if user in self.settings["detected_leechers"]:
+        if user in detected_leechers:
             # We already messaged the user in a previous session
             self.probed_users[user] = "processed_leecher"
             return
 
-        if (num_files <= 0 or num_folders <= 0) and self.probed_users[user] != "requesting_shares":
+        if (num_files <= 0 or num_folders <= 0) and probe_status != "requesting_shares":
             # SoulseekQt only sends the number of shared files/folders to the server once on startup.
             # Verify user's actual number of files/folders.
             self.log("User %s has no shared files according to the server, requesting shares to verify…", user)
@@ -127,7 +140,7 @@ class Plugin(BasePlugin):
             self.core.userbrowse.request_user_shares(user)
             return
 
-        if self.settings["message"]:
+        if settings["message"]:
             log_message = ("Leecher detected, %s is only sharing %s files in %s folders. Going to message "
                            "leecher after transfer…")
         else:
@@ -142,6 +155,11 @@ class Plugin(BasePlugin):
         if user in self.probed_users:
             return
 
+        if user in self.core.buddies.users:
+            # Buddies are never treated as leechers, no need to request their stats
+            self.accept_user(user, "Buddy %s is downloading. Not complaining.", user)
+            return
+
         self.probed_users[user] = "requesting_stats"
 
         if user not in self.core.users.watched:
@@ -169,12 +187,14 @@ class Plugin(BasePlugin):
             self.log("Leecher %s doesn't share enough files. No message is specified in plugin settings.", user)
             return
 
-        for line in self.settings["message"].splitlines():
-            for placeholder, option_key in self.PLACEHOLDERS.items():
-                # Replace message placeholders with actual values specified in the plugin settings
-                line = line.replace(placeholder, str(self.settings[option_key]))
+        # Replace message placeholders with actual values specified in the plugin settings
+        message = self.PLACEHOLDER_PATTERN.sub(
+            lambda match: str(self.settings[self.PLACEHOLDERS[match.group()]]), self.settings["message"])
+
+        show_ui = self.settings["open_private_chat"]
 
-            self.send_private(user, line, show_ui=self.settings["open_private_chat"], switch_page=False)
+        for line in message.splitlines():
+            self.send_private(user, line, show_ui=show_ui, switch_page=False)
 
         if user not in self.settings["detected_leechers"]:
             self.settings["detected_leechers"].append(user)
@@ -24,6 +24,7 @@ from pynicotine.events import events
 from pynicotine.logfacility import log
 from pynicotine.utils import censor_text
 from pynicotine.utils import find_whole_word
+from pynicotine.utils import replace_text
 
 
 class PrivateChat:
@@ -135,8 +136,7 @@ class PrivateChat:
         username, message = user_text
 
         if config.sections["words"]["replacewords"] and message != self.CTCP_VERSION:
-            for word, replacement in config.sections["words"]["autoreplaced"].items():
-                message = message.replace(str(word), str(replacement))
+            message = replace_text(message, replacements=config.sections["words"]["autoreplaced"])
 
         core.send_message_to_server(slskmessages.MessageUser(username, message))
         core.pluginhandler.outgoing_private_chat_notification(username, message)
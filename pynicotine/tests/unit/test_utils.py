@@ -0,0 +1,120 @@
+# COPYRIGHT (C) 2024 Nicotine+ Contributors
+#
+# GNU GENERAL PUBLIC LICENSE
+#    Version 3, 29 June 2007
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest import TestCase
+
+from pynicotine.utils import WORDS_PATTERNS
+from pynicotine.utils import censor_text
+from pynicotine.utils import replace_text
+
+
+class CensorTextTest(TestCase):
+
+    def setUp(self):
+        WORDS_PATTERNS.clear()
+
+    def test_censor_words(self):
+
+        self.assertEqual(censor_text("this is bad, very bad", ["bad"]), "this is ***, very ***")
+        self.assertEqual(censor_text("this is bad", ["bad"], filler="#"), "this is ###")
+        self.assertEqual(censor_text("nothing to see", ["bad"]), "nothing to see")
+
+    def test_censor_overlapping_words(self):
+
+        # Longer words take precedence over words they contain
+        self.assertEqual(censor_text("badword bad", ["bad", "badword"]), "******* ***")
+        self.assertEqual(censor_text("badword bad", ["badword", "bad"]), "******* ***")
+
+    def test_censor_empty_words(self):
+
+        self.assertEqual(censor_text("some text", []), "some text")
+        self.assertEqual(censor_text("some text", [""]), "some text")
+        self.assertEqual(censor_text("some bad text", ["", "bad"]), "some *** text")
+        self.assertNotIn((), WORDS_PATTERNS)
+
+    def test_censor_non_str_words(self):
+
+        self.assertEqual(censor_text("call 555 now", [555]), "call *** now")
+        self.assertEqual(censor_text("1.5 or 0", [1.5, 0]), "*** or 0")
+
+    def test_censor_special_characters(self):
+
+        self.assertEqual(censor_text("a.b axb", ["a.b"]), "*** axb")
+        self.assertEqual(censor_text("(x) x", ["(x)"]), "*** x")
+
+
+class ReplaceTextTest(TestCase):
+
+    def setUp(self):
+        WORDS_PATTERNS.clear()
+
+    def test_replace_words(self):
+
+        replacements = {"teh": "the", "u": "you"}
+
+        self.assertEqual(replace_text("teh cat sees u", replacements), "the cat sees you")
+        self.assertEqual(replace_text("nothing here", {}), "nothing here")
+
+    def test_replace_overlapping_words(self):
+
+        replacements = {"lol": "laughing", "lolcat": "funny cat"}
+
+        self.assertEqual(replace_text("lolcat lol", replacements), "funny cat laughing")
+
+    def test_replacements_do_not_chain(self):
+
+        # Replaced text is not scanned again for other words
+        replacements = {"a": "b", "b": "c"}
+
+        self.assertEqual(replace_text("a b", replacements), "b c")
+
+    def test_replace_empty_words(self):
+
+        self.assertEqual(replace_text("some text", {"": "x"}), "some text")
+        self.assertEqual(replace_text("some text", {"": "x", "text": "words"}), "some words")
+
+    def test_replace_non_str_words(self):
+
+        self.assertEqual(replace_text("room 101", {101: 102}), "room 102")
+
+
+class WordsPatternCacheTest(TestCase):
+
+    def setUp(self):
+        WORDS_PATTERNS.clear()
+
+    def test_pattern_reused(self):
+
+        censor_text("text", ["a", "b"])
+        pattern = WORDS_PATTERNS[("a", "b")]
+
+        censor_text("other text", ["a", "b"])
+        self.assertIs(WORDS_PATTERNS[("a", "b")], pattern)
+        self.assertEqual(len(WORDS_PATTERNS), 1)
+
+    def test_pattern_cache_eviction(self):
+
+        for index in range(8):
+            censor_text("text", [f"word{index}"])
+
+        self.assertEqual(len(WORDS_PATTERNS), 8)
+
+        # Cache is emptied once full, before the new pattern is added
+        censor_text("text", ["word8"])
+        self.assertEqual(list(WORDS_PATTERNS), [("word8",)])
+        self.assertEqual(censor_text("word0 word8", ["word0"]), "***** word8")
@@ -21,6 +21,8 @@ import os
 
 from itertools import chain
 from threading import Thread
+from urllib.parse import quote
+from urllib.parse import unquote
 
 from pynicotine import slskmessages
 from pynicotine.config import config
@@ -337,15 +339,12 @@ class UserBrowse:
     @staticmethod
     def get_soulseek_url(username, path):
 
-        import urllib.parse
         path = path.replace("\\", "/")
-        return "slsk://" + urllib.parse.quote(f"{username}/{path}")
+        return "slsk://" + quote(f"{username}/{path}")
 
     def open_soulseek_url(self, url):
 
-        import urllib.parse
-
-        url = urllib.parse.unquote(url.replace("slsk://", "", 1))
+        url = unquote(url.replace("slsk://", "", 1))
         username, _separator, file_path = url.partition("/")
         file_path = file_path.replace("/", "\\")
 
@@ -22,11 +22,13 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import re
 import sys
 
 UINT32_LIMIT = 4294967295
 UINT64_LIMIT = 18446744073709551615
 FILE_SIZE_SUFFIXES = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+FILE_SIZE_DIVISORS = [1 << (10 * i) for i in range(len(FILE_SIZE_SUFFIXES))]
 PUNCTUATION = [  # ASCII and Unicode punctuation
     "!", '"', "#", "$", "%", "&", "'", "(", ")", "*", "+", ",", "-", ".", "/", ":", ";",
     "<", "=", ">", "?", "@", "[", "\\", "]", "^", "_", "`", "{", "|", "}", "~",
@@ -144,6 +146,7 @@ ILLEGALFILECHARS = ["\\", "/"] + ILLEGALPATHCHARS
 LONG_PATH_PREFIX = "\\\\?\\"
 REPLACEMENTCHAR = "_"
 TRANSLATE_PUNCTUATION = str.maketrans(dict.fromkeys(PUNCTUATION, " "))
+WORDS_PATTERNS = {}
 
 
 def clean_file(basename):
@@ -223,20 +226,22 @@ def _human_speed_or_size(number, unit=None):
     if unit == "B":
         return humanize(number)
 
-    try:
-        for suffix in FILE_SIZE_SUFFIXES:
-            if number < 1024:
-                if number > 999:
-                    return f"{number:.4g} {suffix}"
+    if not isinstance(number, (int, float)):
+        return str(number)
 
-                return f"{number:.3g} {suffix}"
+    # Each suffix covers 10 bits, pick it directly instead of dividing in a loop
+    index = (int(number).bit_length() - 1) // 10 if number >= 1024 else 0
 
-            number /= 1024
+    if index >= len(FILE_SIZE_SUFFIXES):
+        return str(number / FILE_SIZE_DIVISORS[-1] / 1024)
 
-    except TypeError:
-        pass
+    number /= FILE_SIZE_DIVISORS[index]
+    suffix = FILE_SIZE_SUFFIXES[index]
 
-    return str(number)
+    if number > 999:
+        return f"{number:.4g} {suffix}"
+
+    return f"{number:.3g} {suffix}"
 
 
 def human_speed(speed):
@@ -342,13 +347,43 @@ def find_whole_word(word, text):
     return start if whole else -1
 
 
+def _get_words_pattern(words):
+    """Returns a compiled pattern matching any of the given words, reused
+    between calls as long as the word list doesn't change."""
+
+    words = tuple(str(word) for word in words if word)
+    pattern = WORDS_PATTERNS.get(words)
+
+    if pattern is None and words:
+        if len(WORDS_PATTERNS) >= 8:
+            WORDS_PATTERNS.clear()
+
+        # Longest words first, so that they take precedence over their substrings
+        WORDS_PATTERNS[words] = pattern = re.compile(
+            "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+
+    return pattern
+
+
 def censor_text(text, censored_patterns, filler="*"):
 
-    for word in censored_patterns:
-        word = str(word)
-        text = text.replace(word, filler * len(word))
+    pattern = _get_words_pattern(censored_patterns)
+
+    if pattern is None:
+        return text
+
+    return pattern.sub(lambda match: filler * len(match.group()), text)
+
+
+def replace_text(text, replacements):
+
+    pattern = _get_words_pattern(replacements)
+
+    if pattern is None:
+        return text
 
-    return text
+    replacements = {str(word): str(replacement) for word, replacement in replacements.items()}
+    return pattern.sub(lambda match: replacements[match.group()], text)
 
 
 def execute_command(command, replacement=None, background=True, returnoutput=False,